@@ -51,6 +51,7 @@ from .exc import (
     SenseHATReinit,
     SenseStickWarning,
     SenseStickBufferFull,
+    SenseStickCallbackError,
     SenseStickCallbackRead,
 )
 from .formats import (
@@ -139,6 +140,7 @@ class SenseHAT(object):
                 easing = kwargs.pop('easing', linear)
                 max_events = kwargs.pop('max_events', 100)
                 flush_input = kwargs.pop('flush_input', True)
+                include_timestamp = kwargs.pop('include_timestamp', True)
                 emulate_default = bool(int(os.environ.get(
                     'PISENSE_EMULATE', '0')))
                 emulate = kwargs.pop('emulate', emulate_default)
@@ -170,7 +172,9 @@ class SenseHAT(object):
                 # pylint: disable=protected-access
                 self._settings = SenseSettings(settings, emulate=emulate)
                 self._screen = SenseScreen(fps, easing, emulate=emulate)
-                self._stick = SenseStick(max_events, flush_input, emulate=emulate)
+                self._stick = SenseStick(max_events, flush_input,
+                                         emulate=emulate,
+                                         include_timestamp=include_timestamp)
                 self._imu = SenseIMU(self._settings, emulate=emulate)
                 self._environ = SenseEnviron(self._settings, emulate=emulate)
             except:
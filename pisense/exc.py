@@ -41,6 +41,9 @@ class SenseStickWarning(SenseWarning):
 class SenseStickBufferFull(SenseStickWarning):
     "Warning raised when the joystick's event buffer fills"
 
+class SenseStickCallbackError(SenseStickWarning):
+    "Warning raised when a joystick callback raises an exception"
+
 class SenseStickCallbackRead(SenseStickWarning):
     """
     Warning raised when :meth:`SenseStick.read` is called while callbacks are
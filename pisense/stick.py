@@ -47,20 +47,23 @@ import select
 import warnings
 import termios
 from datetime import datetime
-from collections import namedtuple
-from threading import Thread, Event, Lock
-try:
-    from queue import Queue, Empty
-except ImportError:
-    from Queue import Queue, Empty
+from collections import namedtuple, deque
+from threading import Thread, Event, Lock, Condition, current_thread
 
-from .exc import SenseStickBufferFull, SenseStickCallbackRead
+from .exc import (
+    SenseStickBufferFull,
+    SenseStickCallbackError,
+    SenseStickCallbackRead,
+)
 
 # native_str represents the "native" str type (bytes in Py 2, unicode in Py 3)
 # of the interpreter; str is then redefined to always represent unicode
 native_str = str  # pylint: disable=invalid-name
 str = type('')  # pylint: disable=redefined-builtin,invalid-name
 
+# Multiplier converting the microseconds of evdev timestamps to seconds
+_US = 1e-6
+
 
 class StickEvent(namedtuple('StickEvent',
                             ('timestamp', 'direction', 'pressed', 'held'))):
@@ -74,6 +77,8 @@ class StickEvent(namedtuple('StickEvent',
         place. This timestamp is derived from the kernel event so it should be
         accurate even when callbacks have taken time reacting to events. The
         timestamp is a naive :class:`~datetime.datetime` object in local time.
+        If the joystick was constructed with *include_timestamp* set to
+        ``False``, this is always ``None``.
 
     .. attribute:: direction
 
@@ -98,6 +103,31 @@ class StickEvent(namedtuple('StickEvent',
     __slots__ = ()
 
 
+def _when_property(direction, doc):
+    """
+    Construct a property which gets or sets the callback for *direction* in
+    the *_callbacks* dictionary of a :class:`SenseStick`.
+    """
+    # pylint: disable=protected-access
+    def getter(self):
+        with self._callbacks_lock:
+            return self._callbacks.get(direction)
+
+    def setter(self, value):
+        with self._callbacks_lock:
+            if value:
+                self._callbacks[direction] = value
+            else:
+                self._callbacks.pop(direction, None)
+            stopped = self._start_stop_callbacks()
+        # Join the callbacks thread outside the lock (which it acquires);
+        # it may also be a callback itself unassigning the last handler
+        if stopped is not None and stopped is not current_thread():
+            stopped.join()
+
+    return property(getter, setter, doc=doc)
+
+
 class SenseStick(object):
     """
     The :class:`SenseStick` class represents the joystick on the Sense HAT.
@@ -113,10 +143,23 @@ class SenseStick(object):
             if event.pressed and not event.held:
                 print('%s pressed!' % event.direction)
 
+    On Python 3.5.2 and later, the instance may also be used as an
+    asynchronous iterator within an :mod:`asyncio` event loop, in which case
+    events are yielded as they come in without blocking the loop::
+
+        async def main(stick):
+            async for event in stick:
+                if event.pressed and not event.held:
+                    print('%s pressed!' % event.direction)
+
     Alternatively, handler functions can be assigned to the attributes
     :attr:`when_up`, :attr:`when_down`, :attr:`when_left`, :attr:`when_right`,
     :attr:`when_enter`. The assigned functions will be called when any matching
-    event occurs.
+    event occurs. The functions are called from a background thread, one at
+    a time; the joystick continues to be read (and its state updated) while
+    a function runs, but further handlers will not fire until it returns. If
+    a function raises an exception, it is reported as a
+    :exc:`SenseStickCallbackError` warning.
 
     Finally, the attributes :attr:`up`, :attr:`down`, :attr:`left`,
     :attr:`right`, and attr:`enter` can be polled to determine the current
@@ -135,9 +178,14 @@ class SenseStick(object):
     inadvertently execute historical commands (e.g. Up a few times followed by
     Enter).
 
-    Finally, if the *emulate* parameter is ``True``, the instance will connect
-    to the joystick in the `desktop Sense HAT emulator`_ instead of the "real"
-    Sense HAT joystick.
+    If the *emulate* parameter is ``True``, the instance will connect to the
+    joystick in the `desktop Sense HAT emulator`_ instead of the "real" Sense
+    HAT joystick.
+
+    Finally, if the *include_timestamp* parameter is ``False``, the
+    :attr:`~StickEvent.timestamp` of all events will be ``None``. This saves
+    constructing a :class:`~datetime.datetime` for every event, which may be
+    worthwhile for applications which never look at event timestamps.
 
     .. _desktop Sense HAT emulator: https://sense-emu.readthedocs.io/
     """
@@ -145,23 +193,33 @@ class SenseStick(object):
 
     __slots__ = (
         '_flush',
+        '_timestamps',
         '_callbacks_lock',
         '_callbacks_close',
         '_callbacks',
         '_callbacks_thread',
         '_closing',
+        '_wake_r',
+        '_wake_w',
         '_stream',
         '_buffer',
+        '_buffer_cv',
+        '_async_waiters',
         '_read_thread',
         '_pressed',
         '_held',
         '_rotation',
-        '_rot_map',
+        '_key_map',
     )
 
     SENSE_HAT_EVDEV_NAME = 'Raspberry Pi Sense HAT Joystick'
     EVENT_FORMAT = native_str('llHHI')
     EVENT_SIZE = struct.calcsize(EVENT_FORMAT)
+    # The time fields of an event are decoded separately from the rest so the
+    # reader can skip the non-key events (chiefly EV_SYN) cheaply
+    _TIME_STRUCT = struct.Struct(native_str('ll'))
+    _KEY_STRUCT = struct.Struct(native_str('HHI'))
+    _KEY_OFFSET = _TIME_STRUCT.size
 
     EV_KEY = 0x01
 
@@ -175,36 +233,57 @@ class SenseStick(object):
     KEY_DOWN = 108
     KEY_ENTER = 28
 
-    def __init__(self, max_events=100, flush_input=True, emulate=False):
+    _DIRECTIONS = {
+        KEY_UP:    'up',
+        KEY_DOWN:  'down',
+        KEY_LEFT:  'left',
+        KEY_RIGHT: 'right',
+        KEY_ENTER: 'enter',
+    }
+
+    _ROTATE_90 = {
+        KEY_UP:    KEY_RIGHT,
+        KEY_LEFT:  KEY_UP,
+        KEY_DOWN:  KEY_LEFT,
+        KEY_RIGHT: KEY_DOWN,
+        KEY_ENTER: KEY_ENTER,
+    }
+
+    # The path of the joystick's device, cached by _stick_device after the
+    # first successful search
+    _device_path = None
+
+    def __init__(self, max_events=100, flush_input=True, emulate=False,
+                 include_timestamp=True):
         self._flush = flush_input
+        self._timestamps = include_timestamp
         self._callbacks_lock = Lock()
-        self._callbacks_close = Event()
+        self._callbacks_close = None
         self._callbacks = {}
         self._callbacks_thread = None
         self._closing = Event()
         self._stream = False
-        self._buffer = Queue(maxsize=max_events)
+        self._buffer = deque(maxlen=max_events)
+        self._buffer_cv = Condition()
+        self._async_waiters = []
+        # This is just a guess; we can't know the actual joystick state at
+        # initialization. However, if it's incorrect, future events should
+        # correct this
+        self._pressed = set()
+        self._held = set()
+        self._rotation = 0
+        self._key_map = SenseStick._rotate_keys(0)
         if emulate:
             from sense_emu.stick import init_stick_client
             stick_file = init_stick_client()
         else:
-            stick_file = io.open(self._stick_device(), 'rb', buffering=0)
+            stick_file = self._open_stick()
+        # The read end of this pipe is watched alongside the joystick device
+        # so that close() can wake the background thread immediately
+        self._wake_r, self._wake_w = os.pipe()
         self._read_thread = Thread(target=self._read_stick, args=(stick_file,))
         self._read_thread.daemon = True
         self._read_thread.start()
-        # This is just a guess; we can't know the actual joystick state at
-        # initialization. However, if it's incorrect, future events should
-        # correct this
-        self._pressed = set()
-        self._held = set()
-        self._rotation = 0
-        self._rot_map = {
-            SenseStick.KEY_UP: SenseStick.KEY_RIGHT,
-            SenseStick.KEY_LEFT: SenseStick.KEY_UP,
-            SenseStick.KEY_DOWN: SenseStick.KEY_LEFT,
-            SenseStick.KEY_RIGHT: SenseStick.KEY_DOWN,
-            SenseStick.KEY_ENTER: SenseStick.KEY_ENTER,
-        }
 
     def close(self):
         """
@@ -215,12 +294,22 @@ class SenseStick(object):
         """
         if self._read_thread is not None:
             self._closing.set()
+            os.write(self._wake_w, b'\x00')
+            with self._buffer_cv:
+                self._buffer_cv.notify_all()
+                waiters, self._async_waiters = self._async_waiters, []
+            SenseStick._wake_async(waiters)
             self._read_thread.join()
-            if self._callbacks_thread:
-                self._callbacks_thread.join()
             self._read_thread = None
-            self._callbacks_thread = None
+            with self._callbacks_lock:
+                callbacks_thread = self._callbacks_thread
+                self._callbacks_thread = None
+            if (callbacks_thread is not None and
+                    callbacks_thread is not current_thread()):
+                callbacks_thread.join()
             self._buffer = None
+            os.close(self._wake_r)
+            os.close(self._wake_w)
         if self._flush:
             self._flush = False
             try:
@@ -233,6 +322,54 @@ class SenseStick(object):
         while True:
             yield self.read(0 if self._stream else None)
 
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        # This is deliberately written without async/await syntax so the
+        # module remains importable on Python 2; the returned future is
+        # awaitable all the same
+        import asyncio
+        if self._callbacks:
+            warnings.warn(SenseStickCallbackRead(
+                'async iteration while when_* callbacks are assigned'))
+        loop = asyncio.get_event_loop()
+        result = asyncio.Future(loop=loop)
+
+        def attempt(_waiter=None):
+            if result.done():
+                # The caller has given up (e.g. cancelled) on this event
+                return
+            with self._buffer_cv:
+                if self._buffer:
+                    result.set_result(self._buffer.popleft())
+                    return
+                if self._closing.is_set():
+                    result.set_exception(StopAsyncIteration())
+                    return
+                waiter = asyncio.Future(loop=loop)
+                self._async_waiters.append((loop, waiter))
+            waiter.add_done_callback(attempt)
+
+        attempt()
+        return result
+
+    @staticmethod
+    def _wake_async(waiters):
+        # Called from threads other than the event loop's to wake asynchronous
+        # iterators waiting in __anext__
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(SenseStick._wake_waiter, waiter)
+            except RuntimeError:
+                # The waiter's loop has been closed
+                pass
+
+    @staticmethod
+    def _wake_waiter(waiter):
+        if not waiter.done():
+            waiter.set_result(None)
+
     def __enter__(self):
         return self
 
@@ -240,103 +377,193 @@ class SenseStick(object):
         self.close()
 
     @staticmethod
-    def _stick_device():
-        for evdev in glob.glob('/sys/class/input/event*'):
+    def _input_devices():
+        # Returns the sysfs path of each evdev device. Where available,
+        # scandir is used as it lets us filter on the name of each entry
+        # without the extra work glob does
+        path = '/sys/class/input'
+        try:
+            scandir = os.scandir
+        except AttributeError:
+            # Python 2.7 and 3.4 lack scandir
+            return glob.glob(os.path.join(path, 'event*'))
+        try:
+            entries = scandir(path)
+        except OSError as exc:
+            if exc.errno != errno.ENOENT:
+                raise
+            return []
+        try:
+            return [
+                entry.path for entry in entries
+                if entry.name.startswith('event')
+            ]
+        finally:
+            # The scandir iterator only gained close() in Python 3.6
+            close = getattr(entries, 'close', None)
+            if close is not None:
+                close()
+
+    @classmethod
+    def _open_stick(cls):
+        cached = cls._device_path is not None
+        try:
+            return io.open(cls._stick_device(), 'rb', buffering=0)
+        except (IOError, OSError) as exc:
+            # The cached path may be stale if the device was re-enumerated
+            # (e.g. the driver was reloaded); forget it and search once more
+            if not cached or exc.errno not in (errno.ENOENT, errno.ENODEV):
+                raise
+            cls._device_path = None
+            return io.open(cls._stick_device(), 'rb', buffering=0)
+
+    @classmethod
+    def _stick_device(cls):
+        if cls._device_path is not None:
+            return cls._device_path
+        for evdev in cls._input_devices():
             try:
                 with io.open(os.path.join(evdev, 'device', 'name'), 'r') as f:
                     if f.read().strip() == SenseStick.SENSE_HAT_EVDEV_NAME:
-                        return os.path.join('/dev', 'input', os.path.basename(evdev))
+                        cls._device_path = os.path.join(
+                            '/dev', 'input', os.path.basename(evdev))
+                        return cls._device_path
             except IOError as exc:
                 if exc.errno != errno.ENOENT:
                     raise
         raise RuntimeError('unable to locate SenseHAT joystick device')
 
+    @staticmethod
+    def _rotate_keys(rotation):
+        # Returns a dict mapping the key codes reported by the joystick to the
+        # codes they represent at the specified *rotation*
+        keys = {code: code for code in SenseStick._DIRECTIONS}
+        for _ in range(rotation // 90):
+            keys = {
+                code: SenseStick._ROTATE_90[rotated]
+                for code, rotated in keys.items()
+            }
+        return keys
+
     def _read_stick(self, stick_file):
+        # pylint: disable=too-many-locals
+        poll = select.epoll()
+        # The kernel returns as many complete events as fit in the buffer, so
+        # bursts (e.g. from auto-repeat) are drained with a single read
+        event_size = SenseStick.EVENT_SIZE
+        events = bytearray(event_size * 16)
+        # Bind everything used per-event to locals up front; this loop runs
+        # for every joystick event, including the auto-repeat of held keys
+        wake = self._wake_r
+        readinto = stick_file.readinto
+        unpack_time = SenseStick._TIME_STRUCT.unpack_from
+        unpack_key = SenseStick._KEY_STRUCT.unpack_from
+        key_offset = SenseStick._KEY_OFFSET
+        directions = SenseStick._DIRECTIONS
+        pressed_keys = self._pressed
+        held_keys = self._held
+        timestamps = self._timestamps
         try:
-            while not self._closing.wait(0):
-                if select.select([stick_file], [], [], 0.1)[0]:
-                    event = stick_file.read(SenseStick.EVENT_SIZE)
-                    if event == b'':
-                        # This is mostly to ease testing, but also deals with
-                        # some edge cases
-                        break
-                    (
-                        tv_sec,
-                        tv_usec,
-                        evt_type,
-                        code,
-                        value,
-                    ) = struct.unpack(SenseStick.EVENT_FORMAT, event)
-                    if evt_type == SenseStick.EV_KEY:
-                        if self._buffer.full():
-                            warnings.warn(SenseStickBufferFull(
-                                "The internal SenseStick buffer is full; "
-                                "try reading some events!"))
-                            self._buffer.get()
-                        r = self._rotation
-                        while r:
-                            code = self._rot_map[code]
-                            r -= 90
-                        evt = StickEvent(
-                            timestamp=datetime.fromtimestamp(
-                                tv_sec + (tv_usec / 1000000)
-                            ),
-                            direction={
-                                SenseStick.KEY_UP:    'up',
-                                SenseStick.KEY_DOWN:  'down',
-                                SenseStick.KEY_LEFT:  'left',
-                                SenseStick.KEY_RIGHT: 'right',
-                                SenseStick.KEY_ENTER: 'enter',
-                            }[code],
-                            pressed=(value != SenseStick.STATE_RELEASE),
-                            held=(value == SenseStick.STATE_HOLD or (
-                                value == SenseStick.STATE_RELEASE and
-                                code in self._held))
-                        )
-                        if not evt.pressed:
-                            self._pressed -= {code}
-                            self._held -= {code}
-                        elif evt.held:
-                            self._pressed |= {code}  # to correct state
-                            self._held |= {code}
-                        else: # pressed
-                            self._pressed |= {code}
-                            self._held -= {code}  # to correct state
-                        # Only push event onto the queue once the internal
-                        # state is updated; this ensures the various read-only
-                        # properties will be accurate for event handlers that
-                        # subsequently fire (although if they take too long the
-                        # state may change again before the next handler fires)
-                        self._buffer.put(evt)
+            poll.register(stick_file.fileno(), select.EPOLLIN)
+            poll.register(wake, select.EPOLLIN)
+            while True:
+                if any(fd == wake for fd, mask in poll.poll()):
+                    break
+                size = readinto(events)
+                if not size:
+                    # This is mostly to ease testing, but also deals with
+                    # some edge cases
+                    break
+                for offset in range(0, size - size % event_size, event_size):
+                    evt_type, code, value = unpack_key(
+                        events, offset + key_offset)
+                    if evt_type != SenseStick.EV_KEY or code not in directions:
+                        continue
+                    code = self._key_map[code]
+                    pressed = value != SenseStick.STATE_RELEASE
+                    held = value == SenseStick.STATE_HOLD or (
+                        not pressed and code in held_keys)
+                    if not pressed:
+                        pressed_keys.discard(code)
+                        held_keys.discard(code)
+                    elif held:
+                        pressed_keys.add(code)  # to correct state
+                        held_keys.add(code)
+                    else: # pressed
+                        pressed_keys.add(code)
+                        held_keys.discard(code)  # to correct state
+                    if timestamps:
+                        tv_sec, tv_usec = unpack_time(events, offset)
+                        timestamp = datetime.fromtimestamp(
+                            tv_sec + tv_usec * _US)
+                    else:
+                        timestamp = None
+                    # Only queue the event once the internal state is
+                    # updated; this ensures the various read-only properties
+                    # will be accurate for event handlers that subsequently
+                    # fire (although if they take too long the state may
+                    # change again before the next handler fires)
+                    self._queue_event(StickEvent(
+                        timestamp, directions[code], pressed, held))
         finally:
+            poll.close()
             stick_file.close()
 
-    def _run_callbacks(self):
-        while not self._callbacks_close.wait(0) and not self._closing.wait(0):
-            try:
-                event = self._buffer.get(timeout=0.1)
-            except Empty:
-                pass
-            else:
-                with self._callbacks_lock:
-                    try:
-                        callback = self._callbacks[event.direction]
-                    except KeyError:
-                        callback = None
-                if callback is not None:
+    def _queue_event(self, evt):
+        if len(self._buffer) == self._buffer.maxlen:
+            # The deque discards the oldest event for us when the new one is
+            # appended
+            warnings.warn(SenseStickBufferFull(
+                "The internal SenseStick buffer is full; "
+                "try reading some events!"))
+        with self._buffer_cv:
+            self._buffer.append(evt)
+            self._buffer_cv.notify()
+            waiters, self._async_waiters = self._async_waiters, []
+        if waiters:
+            SenseStick._wake_async(waiters)
+
+    def _run_callbacks(self, stop):
+        while True:
+            with self._buffer_cv:
+                while not (self._buffer or stop.is_set() or
+                           self._closing.is_set()):
+                    self._buffer_cv.wait()
+                if stop.is_set() or self._closing.is_set():
+                    break
+                event = self._buffer.popleft()
+            with self._callbacks_lock:
+                callback = self._callbacks.get(event.direction)
+            if callback is not None:
+                # Don't let a broken callback stop all the others
+                # pylint: disable=broad-except
+                try:
                     callback(event)
+                except Exception as exc:
+                    warnings.warn(SenseStickCallbackError(
+                        "Exception in when_%s callback: %r" % (
+                            event.direction, exc)))
 
     def _start_stop_callbacks(self):
-        with self._callbacks_lock:
-            if self._callbacks and not self._callbacks_thread:
-                self._callbacks_close.clear()
-                self._callbacks_thread = Thread(target=self._run_callbacks)
-                self._callbacks_thread.daemon = True
-                self._callbacks_thread.start()
-            elif not self._callbacks and self._callbacks_thread:
-                self._callbacks_close.set()
-                self._callbacks_thread.join()
-                self._callbacks_thread = None
+        # Must be called with _callbacks_lock held. Returns the callbacks
+        # thread if it was told to stop; the caller must join it after
+        # releasing the lock
+        if self._callbacks and self._callbacks_thread is None:
+            # Each thread gets its own stop event so that a thread which is
+            # still stopping can't be revived by its successor starting
+            self._callbacks_close = Event()
+            self._callbacks_thread = Thread(
+                target=self._run_callbacks, args=(self._callbacks_close,))
+            self._callbacks_thread.daemon = True
+            self._callbacks_thread.start()
+        elif not self._callbacks and self._callbacks_thread is not None:
+            thread = self._callbacks_thread
+            self._callbacks_thread = None
+            self._callbacks_close.set()
+            with self._buffer_cv:
+                self._buffer_cv.notify_all()
+            return thread
+        return None
 
     @property
     def rotation(self):
@@ -368,6 +595,7 @@ class SenseStick(object):
         if value % 90:
             raise ValueError('rotation must be a multiple of 90')
         self._rotation = value % 360
+        self._key_map = SenseStick._rotate_keys(self._rotation)
 
     def read(self, timeout=None):
         """
@@ -384,13 +612,49 @@ class SenseStick(object):
             accesses). Mixing these programming styles can result in missing
             events.
         """
-        if self._callbacks_thread is not None:
+        if self._callbacks:
             warnings.warn(SenseStickCallbackRead(
                 'read called while when_* callbacks are assigned'))
-        try:
-            return self._buffer.get(timeout=timeout)
-        except Empty:
-            return None
+        with self._buffer_cv:
+            buf = self._wait_buffer(timeout)
+            try:
+                return buf.popleft()
+            except IndexError:
+                return None
+
+    def read_many(self, max_events=32, timeout=None):
+        """
+        Wait up to *timeout* seconds for joystick events. Return a list of up
+        to *max_events* :class:`StickEvent` instances, in the order they
+        occurred, which will be empty if no events occur in time.
+
+        This is equivalent to calling :meth:`read` repeatedly until it returns
+        ``None`` (or *max_events* events have been read) but is cheaper,
+        particularly for applications like games which process all events
+        that have occurred since the last frame. As with :meth:`read`,
+        calling this method while callbacks are assigned will trigger a
+        :exc:`SenseStickCallbackRead` warning.
+        """
+        if self._callbacks:
+            warnings.warn(SenseStickCallbackRead(
+                'read_many called while when_* callbacks are assigned'))
+        with self._buffer_cv:
+            buf = self._wait_buffer(timeout)
+            popleft = buf.popleft
+            return [popleft() for _ in range(min(max_events, len(buf)))]
+
+    def _wait_buffer(self, timeout):
+        # Must be called with _buffer_cv held. Returns the buffer to read
+        # events from; if close() is called while we're waiting it will
+        # discard self._buffer, so we keep our own reference to it and the
+        # caller will simply find it empty
+        buf = self._buffer
+        if timeout is None:
+            while not buf and not self._closing.is_set():
+                self._buffer_cv.wait()
+        elif not buf and not self._closing.is_set():
+            self._buffer_cv.wait(timeout)
+        return buf
 
     @property
     def stream(self):
@@ -428,22 +692,9 @@ class SenseStick(object):
         """
         return SenseStick.KEY_UP in self._held
 
-    @property
-    def when_up(self):
-        """
+    when_up = _when_property('up', """
         The function to call when the joystick is moved upward.
-        """
-        with self._callbacks_lock:
-            return self._callbacks.get('up')
-
-    @when_up.setter
-    def when_up(self, value):
-        with self._callbacks_lock:
-            if value:
-                self._callbacks['up'] = value
-            else:
-                self._callbacks.pop('up', None)
-        self._start_stop_callbacks()
+        """)
 
     @property
     def down(self):
@@ -459,22 +710,9 @@ class SenseStick(object):
         """
         return SenseStick.KEY_DOWN in self._held
 
-    @property
-    def when_down(self):
-        """
+    when_down = _when_property('down', """
         The function to call when the joystick is moved downward.
-        """
-        with self._callbacks_lock:
-            return self._callbacks.get('down')
-
-    @when_down.setter
-    def when_down(self, value):
-        with self._callbacks_lock:
-            if value:
-                self._callbacks['down'] = value
-            else:
-                self._callbacks.pop('down', None)
-        self._start_stop_callbacks()
+        """)
 
     @property
     def left(self):
@@ -490,22 +728,9 @@ class SenseStick(object):
         """
         return SenseStick.KEY_LEFT in self._held
 
-    @property
-    def when_left(self):
-        """
+    when_left = _when_property('left', """
         The function to call when the joystick is moved leftward.
-        """
-        with self._callbacks_lock:
-            return self._callbacks.get('left')
-
-    @when_left.setter
-    def when_left(self, value):
-        with self._callbacks_lock:
-            if value:
-                self._callbacks['left'] = value
-            else:
-                self._callbacks.pop('left', None)
-        self._start_stop_callbacks()
+        """)
 
     @property
     def right(self):
@@ -521,22 +746,9 @@ class SenseStick(object):
         """
         return SenseStick.KEY_RIGHT in self._held
 
-    @property
-    def when_right(self):
-        """
+    when_right = _when_property('right', """
         The function to call when the joystick is moved rightward.
-        """
-        with self._callbacks_lock:
-            return self._callbacks.get('right')
-
-    @when_right.setter
-    def when_right(self, value):
-        with self._callbacks_lock:
-            if value:
-                self._callbacks['right'] = value
-            else:
-                self._callbacks.pop('right', None)
-        self._start_stop_callbacks()
+        """)
 
     @property
     def enter(self):
@@ -552,19 +764,6 @@ class SenseStick(object):
         """
         return SenseStick.KEY_ENTER in self._held
 
-    @property
-    def when_enter(self):
-        """
+    when_enter = _when_property('enter', """
         The function to call when the joystick is pressed in or released.
-        """
-        with self._callbacks_lock:
-            return self._callbacks.get('enter')
-
-    @when_enter.setter
-    def when_enter(self, value):
-        with self._callbacks_lock:
-            if value:
-                self._callbacks['enter'] = value
-            else:
-                self._callbacks.pop('enter', None)
-        self._start_stop_callbacks()
+        """)
@@ -39,6 +39,7 @@ import os
 import glob
 import mmap
 import fcntl
+from collections import namedtuple
 import numpy as np
 
 import pytest
@@ -145,8 +146,38 @@ def RTHumidity(request, Settings):
     return result
 
 
+DirEntry = namedtuple('DirEntry', ('name', 'path'))
+
+
+class FakeScandir(object):
+    # Emulates the iterator returned by os.scandir, recording whether it was
+    # closed
+    def __init__(self, path, names):
+        self._entries = iter([
+            DirEntry(name, os.path.join(path, name)) for name in names
+        ])
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._entries)
+
+    next = __next__  # XXX 2.7 compat
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture()
+def fake_scandir():
+    return FakeScandir
+
+
 @pytest.fixture()
-def hat_devices(request, tmpdir, _open=io.open, _glob=glob.glob):
+def hat_devices(request, tmpdir, _open=io.open, _glob=glob.glob,
+                _scandir=getattr(os, 'scandir', None)):
     # Set up a pipe to represent the input device, and a 128-byte, mmap'd
     # file to represent the frame-buffer
     rstick, wstick = os.pipe()
@@ -162,6 +193,12 @@ def hat_devices(request, tmpdir, _open=io.open, _glob=glob.glob):
             return ['/sys/class/input/event%d' % i for i in range(5)]
         else:
             return _glob(pattern)
+    def scandir_patch(path):
+        if path == '/sys/class/input':
+            return FakeScandir(
+                path, ['mice'] + ['event%d' % i for i in range(5)])
+        else:
+            return _scandir(path)
     def open_patch(filename, mode, *args, **kwargs):
         # The second framebuffer and third input device belong to the Sense HAT
         if filename == '/sys/class/graphics/fb1/name':
@@ -178,13 +215,17 @@ def hat_devices(request, tmpdir, _open=io.open, _glob=glob.glob):
         else:
             return _open(filename, mode, *args, **kwargs)
     glob_mock = mock.patch('glob.glob', side_effect=glob_patch)
+    scandir_mock = mock.patch('os.scandir', side_effect=scandir_patch,
+                              create=True)
     open_mock = mock.patch('io.open', side_effect=open_patch)
     def fin():
         fbfile.close()
         glob_mock.stop()
+        scandir_mock.stop()
         open_mock.stop()
     request.addfinalizer(fin)
     glob_mock.start()
+    scandir_mock.start()
     open_mock.start()
     # Last argument to fdopen is bufsize (in 2.7) and buffering (in 3+)
     return fbfile, os.fdopen(wstick, 'wb', 0)
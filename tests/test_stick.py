@@ -35,14 +35,15 @@ from __future__ import (
 )
 
 import io
-import glob
+import os
 import errno
 import struct
+import select
 import warnings
 from math import modf
 from time import sleep, mktime
 from datetime import datetime
-from threading import Event
+from threading import Event, Thread
 
 import pytest
 
@@ -119,19 +120,21 @@ def test_stick_init(stick_device):
     stick = SenseStick(10, flush_input=False)
     try:
         assert not stick._flush
-        assert stick._buffer.maxsize == 10
+        assert stick._buffer.maxlen == 10
     finally:
         stick.close()
 
 
-def test_stick_init_not_found():
-    _glob = glob.glob
+def test_stick_init_not_found(fake_scandir):
+    _scandir = getattr(os, 'scandir', None)
     _open = io.open
     events = ['/sys/class/input/event%d' % i for i in range(5)]
     names = {event + '/device/name': 'foo' for event in events}
-    with mock.patch('glob.glob') as glob_mock:
-        glob_mock.side_effect = lambda pattern: (
-            events if pattern == '/sys/class/input/event*' else _glob(pattern)
+    with mock.patch.object(SenseStick, '_device_path', None), \
+            mock.patch('os.scandir', create=True) as scandir_mock:
+        scandir_mock.side_effect = lambda path: (
+            fake_scandir(path, [os.path.basename(event) for event in events])
+            if path == '/sys/class/input' else _scandir(path)
         )
         with mock.patch('io.open') as open_mock:
             open_mock.side_effect = lambda filename, mode, *args, **kwargs: (
@@ -142,8 +145,8 @@ def test_stick_init_not_found():
                 SenseStick()
 
 
-def test_stick_init_fail():
-    _glob = glob.glob
+def test_stick_init_fail(fake_scandir):
+    _scandir = getattr(os, 'scandir', None)
     _open = io.open
     events = ['/sys/class/input/event%d' % i for i in range(5)]
     names = {
@@ -152,9 +155,11 @@ def test_stick_init_fail():
         )
         for event in events
     }
-    with mock.patch('glob.glob') as glob_mock:
-        glob_mock.side_effect = lambda pattern: (
-            events if pattern == '/sys/class/input/event*' else _glob(pattern)
+    with mock.patch.object(SenseStick, '_device_path', None), \
+            mock.patch('os.scandir', create=True) as scandir_mock:
+        scandir_mock.side_effect = lambda path: (
+            fake_scandir(path, [os.path.basename(event) for event in events])
+            if path == '/sys/class/input' else _scandir(path)
         )
         with mock.patch('io.open') as open_mock:
             def open_patch(filename, mode, *args, **kwargs):
@@ -167,6 +172,50 @@ def test_stick_init_fail():
                 SenseStick()
 
 
+def test_stick_init_no_input_class():
+    _scandir = getattr(os, 'scandir', None)
+    def scandir_patch(path):
+        if path == '/sys/class/input':
+            raise OSError(errno.ENOENT, 'No such file or directory')
+        return _scandir(path)
+    with mock.patch.object(SenseStick, '_device_path', None), \
+            mock.patch('os.scandir', create=True) as scandir_mock:
+        scandir_mock.side_effect = scandir_patch
+        with pytest.raises(RuntimeError):
+            SenseStick()
+
+
+def test_stick_device_cached(stick_device):
+    with mock.patch.object(SenseStick, '_device_path', None):
+        assert SenseStick._stick_device() == '/dev/input/event2'
+        with mock.patch('os.scandir', create=True) as scandir_mock:
+            assert SenseStick._stick_device() == '/dev/input/event2'
+            assert not scandir_mock.called
+
+
+def test_stick_device_scandir_closed(stick_device, fake_scandir):
+    entries = fake_scandir(
+        '/sys/class/input', ['mice'] + ['event%d' % i for i in range(5)])
+    with mock.patch.object(SenseStick, '_device_path', None), \
+            mock.patch('os.scandir', return_value=entries, create=True):
+        assert SenseStick._stick_device() == '/dev/input/event2'
+        assert entries.closed
+
+
+def test_stick_device_stale(stick_device):
+    with mock.patch.object(SenseStick, '_device_path', '/dev/input/event7'):
+        with SenseStick():
+            assert SenseStick._device_path == '/dev/input/event2'
+
+
+def test_stick_device_no_scandir(stick_device):
+    # Python 2.7 and 3.4 lack scandir; glob is used instead
+    with mock.patch.object(SenseStick, '_device_path', None), \
+            mock.patch.dict(os.__dict__):
+        os.__dict__.pop('scandir', None)
+        assert SenseStick._stick_device() == '/dev/input/event2'
+
+
 def test_stick_close_idemoptent(stick_device):
     stick = SenseStick()
     stick.close()
@@ -175,6 +224,44 @@ def test_stick_close_idemoptent(stick_device):
     stick.close()
 
 
+def test_stick_close_prompt(stick_device, _epoll=select.epoll):
+    calls = []
+    class EpollWrapper(object):
+        def __init__(self):
+            self._poll = _epoll()
+        def __getattr__(self, name):
+            return getattr(self._poll, name)
+        def poll(self, *args, **kwargs):
+            calls.append((args, kwargs))
+            return self._poll.poll(*args, **kwargs)
+    with mock.patch('select.epoll', EpollWrapper):
+        stick = SenseStick()
+        stick.when_up = lambda evt: None
+        reader = stick._read_thread
+        callbacks = stick._callbacks_thread
+        while not calls:
+            sleep(0.01)
+        stick.close()
+    # Closing must not rely on a poll timeout expiring; the reader blocks
+    # indefinitely and is woken by close()
+    assert calls
+    assert all(call == ((), {}) for call in calls)
+    assert not reader.is_alive()
+    assert not callbacks.is_alive()
+
+
+def test_stick_close_while_reading(stick_device):
+    stick = SenseStick()
+    result = []
+    reader = Thread(target=lambda: result.append(stick.read()))
+    reader.start()
+    sleep(0.05)
+    stick.close()
+    reader.join(1)
+    assert not reader.is_alive()
+    assert result == [None]
+
+
 def test_stick_context_handler(stick_device):
     with SenseStick() as stick:
         pass
@@ -190,6 +277,13 @@ def test_stick_read(stick_device):
         assert stick.read(0.01) is None
 
 
+def test_stick_read_no_timestamp(stick_device):
+    with SenseStick(include_timestamp=False) as stick:
+        evt = StickEvent(datetime.now(), 'up', True, False)
+        stick_device.write(make_event(evt))
+        assert stick.read() == evt._replace(timestamp=None)
+
+
 def test_stick_read_non_key_event(stick_device):
     with SenseStick() as stick:
         evt = StickEvent(datetime.now(), 'up', True, False)
@@ -200,6 +294,34 @@ def test_stick_read_non_key_event(stick_device):
         assert stick.read(0.01) is None
 
 
+def test_stick_read_unknown_key(stick_device):
+    with SenseStick() as stick:
+        evt = StickEvent(datetime.now(), 'up', True, False)
+        # Test the device silently ignores key codes other than the joystick's
+        stick_device.write(struct.pack(SenseStick.EVENT_FORMAT, 0, 0,
+                                       SenseStick.EV_KEY, 30,
+                                       SenseStick.STATE_PRESS))
+        stick_device.write(make_event(evt))
+        assert stick.read() == evt
+        assert stick.read(0.01) is None
+
+
+def test_stick_read_batch(stick_device):
+    with SenseStick() as stick:
+        events = [
+            StickEvent(datetime.now(), direction, pressed, held)
+            for direction in ('up', 'down', 'left', 'right', 'enter')
+            for pressed, held in ((True, False), (True, True), (False, True))
+        ]
+        # Write all the events (interspersed with non-key events) in a single
+        # chunk; more than fit in the reader's buffer
+        stick_device.write(b''.join(
+            make_event(e) + make_event(e, event_type=0x00) for e in events))
+        for evt in events:
+            assert stick.read(1) == evt
+        assert stick.read(0.01) is None
+
+
 def test_stick_iter(stick_device):
     with SenseStick() as stick:
         evt1 = StickEvent(datetime.now(), 'up', True, False)
@@ -213,6 +335,51 @@ def test_stick_iter(stick_device):
         assert next(it) == evt2
 
 
+@pytest.mark.skipif(sys.version_info < (3, 5, 2),
+                    reason='asynchronous iterators require Python 3.5.2+')
+def test_stick_async_iter(stick_device):
+    import asyncio
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        with SenseStick() as stick:
+            evt1 = StickEvent(datetime.now(), 'up', True, False)
+            evt2 = StickEvent(datetime.now(), 'up', False, False)
+            it = stick.__aiter__()
+            # Wait for an event that hasn't happened yet
+            pending = it.__anext__()
+            assert not pending.done()
+            stick_device.write(make_event(evt1))
+            assert loop.run_until_complete(pending) == evt1
+            # Retrieve an event that's already queued
+            stick_device.write(make_event(evt2))
+            while not stick._buffer:
+                sleep(0.01)
+            assert loop.run_until_complete(it.__anext__()) == evt2
+            pending = it.__anext__()
+            loop.call_later(0.05, stick.close)
+            with pytest.raises(StopAsyncIteration):
+                loop.run_until_complete(pending)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def test_stick_read_many(stick_device):
+    with SenseStick() as stick:
+        events = [
+            StickEvent(datetime.now(), direction, pressed, False)
+            for direction in ('up', 'down', 'left')
+            for pressed in (True, False)
+        ]
+        stick_device.write(b''.join(make_event(e) for e in events))
+        while len(stick._buffer) < len(events):
+            sleep(0.01)
+        assert stick.read_many(4) == events[:4]
+        assert stick.read_many() == events[4:]
+        assert stick.read_many(timeout=0.01) == []
+
+
 def test_stick_stream(stick_device):
     with SenseStick() as stick:
         evt = StickEvent(datetime.now(), 'up', True, False)
@@ -251,6 +418,17 @@ def test_stick_rotation(stick_device):
             stick.rotation = 45
 
 
+def test_stick_rotation_all(stick_device):
+    with SenseStick() as stick:
+        for rotation, direction in [
+                (0, 'up'), (90, 'right'), (180, 'down'), (270, 'left'),
+                (360, 'up'), (-90, 'left')]:
+            stick.rotation = rotation
+            evt = StickEvent(datetime.now(), 'up', True, False)
+            stick_device.write(make_event(evt))
+            assert stick.read() == evt._replace(direction=direction)
+
+
 def test_stick_buffer_filled(stick_device):
     with warnings.catch_warnings(record=True) as w:
         with SenseStick(max_events=2) as stick:
@@ -264,7 +442,7 @@ def test_stick_buffer_filled(stick_device):
                 ]
             ]
             stick_device.write(b''.join(make_event(e) for e in events))
-            while stick._buffer.empty():
+            while not stick._buffer:
                 sleep(0.01)
             sleep(0.1) # let the tiny buffer fill and overflow
             stick.read()
@@ -345,14 +523,92 @@ def test_stick_callbacks_unassigned(stick_device):
 
 def test_stick_callbacks_shutdown(stick_device):
     with SenseStick() as stick:
-        assert stick._callbacks_thread is None
+        assert not stick._callbacks
         directions = {'left', 'right', 'up', 'down', 'enter'}
+        assert not stick._callbacks_thread
         for d in directions:
             setattr(stick, 'when_' + d, lambda evt: None)
-            assert stick._callbacks_thread is not None
+            assert stick._callbacks
+            assert stick._callbacks_thread
+        thread = stick._callbacks_thread
         for d in directions:
             setattr(stick, 'when_' + d, None)
-        assert stick._callbacks_thread is None
+        assert not stick._callbacks
+        assert not stick._callbacks_thread
+        assert not thread.is_alive()
+        # With all callbacks removed, events are queued for read() again
+        evt = StickEvent(datetime.now(), 'up', True, False)
+        stick_device.write(make_event(evt))
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            assert stick.read() == evt
+            assert len(w) == 0
+
+
+def test_stick_callbacks_slow(stick_device):
+    with SenseStick() as stick:
+        started = Event()
+        finish = Event()
+        received = []
+        def handler(evt):
+            received.append(evt)
+            started.set()
+            finish.wait(1)
+        stick.when_up = handler
+        stick.when_down = handler
+        up = StickEvent(datetime.now(), 'up', True, False)
+        down = StickEvent(datetime.now(), 'down', True, False)
+        stick_device.write(make_event(up))
+        assert started.wait(1)
+        # The joystick's state must keep updating while a handler runs
+        stick_device.write(make_event(down))
+        for i in range(100):
+            if stick.down:
+                break
+            sleep(0.01)
+        assert stick.down
+        assert received == [up]
+        finish.set()
+        for i in range(100):
+            if len(received) == 2:
+                break
+            sleep(0.01)
+        assert received == [up, down]
+
+
+def test_stick_callbacks_buffered(stick_device):
+    with SenseStick() as stick:
+        evt = StickEvent(datetime.now(), 'left', True, False)
+        stick_device.write(make_event(evt))
+        for i in range(100):
+            if stick.left:
+                break
+            sleep(0.01)
+        # Events queued before a handler is assigned are still delivered
+        received = Event()
+        stick.when_left = lambda e: received.set() if e == evt else None
+        assert received.wait(1)
+
+
+def test_stick_callbacks_error(stick_device):
+    with SenseStick() as stick:
+        marker = Event()
+        def handler(evt):
+            marker.set()
+            raise ValueError('broken handler')
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            stick.when_up = handler
+            stick_device.write(make_event(
+                StickEvent(datetime.now(), 'up', True, False)))
+            assert marker.wait(1)
+            stick.when_up = None
+            # The reader must survive the broken handler
+            evt = StickEvent(datetime.now(), 'down', True, False)
+            stick_device.write(make_event(evt))
+            assert stick.read(1) == evt
+            assert len(w) == 1
+            assert w[0].category == SenseStickCallbackError
 
 
 def test_stick_callbacks_warning(stick_device):